@@ -1,6 +1,7 @@
 import random
 
 valid_inputs = ['rock', 'paper', 'scissors']
+beats = {'rock': 'scissors', 'paper': 'rock', 'scissors': 'paper'}
 
 
 def user_selection():
@@ -22,9 +23,7 @@ def computer_selection():
 def check_result(human_play, computer_play):
     if human_play == computer_play:
         result = "It's a Draw"
-    elif (human_play == 'rock' and computer_play == 'scissors') or \
-            (human_play == 'paper' and computer_play == 'rock') or \
-            (human_play == 'scissors' and computer_play == 'paper'):
+    elif beats[human_play] == computer_play:
         result = "You Win!"
     else:
         result = "Computer Wins!"
@@ -54,4 +53,5 @@ def game():
             break
 
 
-game()
+if __name__ == '__main__':
+    game()